@@ -26,6 +26,7 @@ def main(
     experiment_launcher: Literal["sequential", "joblib"] = "joblib",
     max_epochs: int = 50,
     epoch_num_steps: int = 5000,
+    compile_model: bool = False,
 ) -> None:
     """
     Train an agent using TD3 on a specified MuJoCo task, potentially running multiple experiments with different seeds
@@ -39,6 +40,7 @@ def main(
         You can use "joblib" for parallel execution of whole experiments.
     :param max_epochs: the maximum number of training epochs.
     :param epoch_num_steps: the number of environment steps per epoch.
+    :param compile_model: whether to compile the actor and critic networks via `torch.compile`.
     """
     persistence_base_dir = os.path.abspath(os.path.join(persistence_base_dir, task))
     experiment_config = ExperimentConfig(persistence_base_dir=persistence_base_dir, watch=False)
@@ -60,7 +62,9 @@ def main(
 
     hidden_sizes = (256, 256)
     experiment_builder = (
-        TD3ExperimentBuilder(env_factory, experiment_config, training_config)
+        TD3ExperimentBuilder(
+            env_factory, experiment_config, training_config, compile_model=compile_model
+        )
         .with_td3_params(
             TD3Params(
                 tau=0.005,
@@ -4,10 +4,13 @@ import argparse
 import datetime
 import os
 import pprint
+from typing import Any
 
 import gymnasium as gym
 import numpy as np
 import torch
+import torch.distributed as dist
+from torch.nn.parallel import DistributedDataParallel
 from torch.utils.tensorboard import SummaryWriter
 
 from examples.offline.utils import load_buffer_d4rl, normalize_all_obs_in_replay_buffer
@@ -15,14 +18,39 @@ from tianshou.algorithm import TD3BC
 from tianshou.algorithm.algorithm_base import Algorithm
 from tianshou.algorithm.modelfree.ddpg import ContinuousDeterministicPolicy
 from tianshou.algorithm.optim import AdamOptimizerFactory
-from tianshou.data import Collector, CollectStats
+from tianshou.data import Collector, CollectStats, ReplayBuffer
+from tianshou.data.types import BatchWithReturnsProtocol, RolloutBatchProtocol
 from tianshou.env import BaseVectorEnv, SubprocVectorEnv, VectorEnvNormObs
-from tianshou.exploration import GaussianNoise
 from tianshou.trainer import OfflineTrainerParams
-from tianshou.utils import TensorboardLogger, WandbLogger
+from tianshou.utils import LazyLogger, TensorboardLogger, WandbLogger
 from tianshou.utils.net.common import Net
 from tianshou.utils.net.continuous import ContinuousActorDeterministic, ContinuousCritic
 from tianshou.utils.space_info import SpaceInfo
+from tianshou.utils.torch_utils import compile_module
+
+
+class TD3BCWithAsyncTransfer(TD3BC):
+    """TD3BC which moves each sampled batch to the GPU via pinned memory and non-blocking copies.
+
+    The host-to-device transfer of the (large) offline batches can then overlap with the
+    kernels already queued on the device instead of stalling the host on every update.
+    On other devices, batches are passed on unchanged.
+    """
+
+    def __init__(self, *args: Any, device: str | torch.device, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._transfer_device = torch.device(device)
+
+    def _preprocess_batch(
+        self,
+        batch: RolloutBatchProtocol,
+        buffer: ReplayBuffer,
+        indices: np.ndarray,
+    ) -> RolloutBatchProtocol | BatchWithReturnsProtocol:
+        batch = super()._preprocess_batch(batch, buffer, indices)
+        if self._transfer_device.type == "cuda":
+            batch.to_torch_(device=self._transfer_device, non_blocking=True)
+        return batch
 
 
 def get_args() -> argparse.Namespace:
@@ -40,7 +68,6 @@ def get_args() -> argparse.Namespace:
     parser.add_argument("--batch_size", type=int, default=256)
 
     parser.add_argument("--alpha", type=float, default=2.5)
-    parser.add_argument("--exploration_noise", type=float, default=0.1)
     parser.add_argument("--policy_noise", type=float, default=0.2)
     parser.add_argument("--noise_clip", type=float, default=0.5)
     parser.add_argument("--update_actor_freq", type=int, default=2)
@@ -75,14 +102,29 @@ def get_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def test_td3_bc() -> None:
+def test_td3_bc(rank: int = 0, world_size: int = 1) -> None:  # noqa: C901
+    """
+    :param rank: the rank of this process; only rank 0 evaluates, logs and saves the policy
+    :param world_size: the number of processes (one per GPU); if greater than 1, the networks are trained
+        with DistributedDataParallel, each process sampling its batches from the full replay buffer with
+        a different seed
+    """
     args = get_args()
+    distributed = world_size > 1
+    if distributed:
+        local_rank = int(os.environ.get("LOCAL_RANK", str(rank)))
+        dist.init_process_group(backend="nccl", rank=rank, world_size=world_size)
+        torch.cuda.set_device(local_rank)
+        args.device = f"cuda:{local_rank}"
     env = gym.make(args.task)
     space_info = SpaceInfo.from_env(env)
     args.state_shape = space_info.observation_info.obs_shape
     args.action_shape = space_info.action_info.action_shape
     args.max_action = space_info.action_info.max_action
     args.min_action = space_info.action_info.min_action
+    # the env is only needed for introspection
+    action_space = env.action_space
+    env.close()
     print("device:", args.device)
     print("Observations shape:", args.state_shape)
     print("Actions shape:", args.action_shape)
@@ -92,15 +134,16 @@ def test_td3_bc() -> None:
     args.action_dim = space_info.action_info.action_dim
     print("Max_action", args.max_action)
 
-    test_envs: BaseVectorEnv
-    test_envs = SubprocVectorEnv([lambda: gym.make(args.task) for _ in range(args.num_test_envs)])
-    if args.norm_obs:
-        test_envs = VectorEnvNormObs(test_envs, update_obs_rms=False)
-
     # seed
+    # the same seed is used on all ranks, such that the networks (including the lagged target
+    # networks, which DDP does not synchronize) are initialized identically; the ranks are
+    # decorrelated once the networks have been created (see below)
     np.random.seed(args.seed)
     torch.manual_seed(args.seed)
-    test_envs.seed(args.seed)
+    if torch.cuda.is_available():
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
 
     # model
     # actor network
@@ -132,13 +175,21 @@ def test_td3_bc() -> None:
     critic1_optim = AdamOptimizerFactory(lr=args.critic_lr)
     critic2 = ContinuousCritic(preprocess_net=net_c2).to(args.device)
     critic2_optim = AdamOptimizerFactory(lr=args.critic_lr)
+    if args.device.startswith("cuda"):
+        # the critics only process update batches of a fixed size, so they can use CUDA graphs;
+        # the actor also serves the test collector, whose batch size shrinks as episodes end,
+        # so it is compiled for dynamic shapes instead of recompiling for every batch size
+        compile_module(actor, mode="default", dynamic=None)
+        for critic in (critic1, critic2):
+            compile_module(critic)
 
     policy = ContinuousDeterministicPolicy(
         actor=actor,
-        exploration_noise=GaussianNoise(sigma=args.exploration_noise),
-        action_space=env.action_space,
+        # training is offline and the test collector does not add exploration noise
+        exploration_noise=None,
+        action_space=action_space,
     )
-    algorithm: TD3BC = TD3BC(
+    algorithm: TD3BC = TD3BCWithAsyncTransfer(
         policy=policy,
         policy_optim=actor_optim,
         critic=critic1,
@@ -152,15 +203,43 @@ def test_td3_bc() -> None:
         noise_clip=args.noise_clip,
         alpha=args.alpha,
         n_step_return_horizon=args.n_step,
+        device=args.device,
     )
 
     # load a previous policy
     if args.resume_path:
-        algorithm.load_state_dict(torch.load(args.resume_path, map_location=args.device))
+        algorithm.load_state_dict(
+            torch.load(args.resume_path, map_location=args.device, mmap=True, weights_only=True)
+        )
         print("Loaded agent from: ", args.resume_path)
 
+    if distributed:
+        # the lagged (target) networks were created as copies of the unwrapped networks above and
+        # are updated from the same parameter objects, so only the trained networks need wrapping
+        algorithm.policy.actor = DistributedDataParallel(  # type: ignore[assignment]
+            actor, device_ids=[local_rank], static_graph=True
+        )
+        algorithm.critic = DistributedDataParallel(
+            critic1, device_ids=[local_rank], static_graph=True
+        )
+        algorithm.critic2 = DistributedDataParallel(
+            critic2, device_ids=[local_rank], static_graph=True
+        )
+        # from here on, each rank draws its own noise (e.g. TD3's target policy smoothing)
+        torch.manual_seed(args.seed + rank)
+
     # collector
-    test_collector = Collector[CollectStats](algorithm, test_envs)
+    # only rank 0 evaluates the policy, so the other ranks do not need test envs
+    test_envs: BaseVectorEnv | None = None
+    test_collector: Collector[CollectStats] | None = None
+    if rank == 0:
+        test_envs = SubprocVectorEnv(
+            [lambda: gym.make(args.task) for _ in range(args.num_test_envs)]
+        )
+        if args.norm_obs:
+            test_envs = VectorEnvNormObs(test_envs, update_obs_rms=False)
+        test_envs.seed(args.seed)
+        test_collector = Collector[CollectStats](algorithm, test_envs)
 
     # log
     now = datetime.datetime.now().strftime("%y%m%d-%H%M%S")
@@ -169,37 +248,63 @@ def test_td3_bc() -> None:
     log_path = os.path.join(args.logdir, log_name)
 
     # logger
-    writer = SummaryWriter(log_path)
-    writer.add_text("args", str(args))
-    logger: WandbLogger | TensorboardLogger
-    if args.logger == "tensorboard":
-        logger = TensorboardLogger(writer)
+    logger: WandbLogger | TensorboardLogger | LazyLogger
+    if rank != 0:
+        logger = LazyLogger()
     else:
-        logger = WandbLogger(
-            save_interval=1,
-            name=log_name.replace(os.path.sep, "__"),
-            run_id=args.resume_id,
-            config=args,
-            project=args.wandb_project,
-        )
-        logger.load(writer)
+        # events are queued and flushed by the writer's background thread instead of after every write
+        writer = SummaryWriter(log_path, flush_secs=30, max_queue=1000)
+        writer.add_text("args", str(args))
+        if args.logger == "tensorboard":
+            logger = TensorboardLogger(writer, write_flush=False)
+        else:
+            logger = WandbLogger(
+                save_interval=1,
+                write_flush=False,
+                name=log_name.replace(os.path.sep, "__"),
+                run_id=args.resume_id,
+                config=args,
+                project=args.wandb_project,
+            )
+            logger.load(writer)
 
     def save_best_fn(policy: Algorithm) -> None:
-        torch.save(policy.state_dict(), os.path.join(log_path, "policy.pth"))
+        if rank == 0:
+            state_dict = policy.state_dict()
+            if distributed:
+                # drop the prefix added by the DistributedDataParallel wrappers, such that
+                # the checkpoint can be loaded in single-process mode
+                state_dict = {k.replace(".module.", ".", 1): v for k, v in state_dict.items()}
+            torch.save(state_dict, os.path.join(log_path, "policy.pth"))
 
     def watch() -> None:
         if args.resume_path is None:
             args.resume_path = os.path.join(log_path, "policy.pth")
 
-        algorithm.load_state_dict(torch.load(args.resume_path, map_location=torch.device("cpu")))
+        algorithm.load_state_dict(
+            torch.load(
+                args.resume_path,
+                map_location=torch.device("cpu"),
+                mmap=True,
+                weights_only=True,
+            )
+        )
+        env = gym.make(args.task)
         collector = Collector[CollectStats](algorithm, env)
         collector.collect(n_episode=1, render=1 / 35)
+        collector.close()
 
     if not args.watch:
-        replay_buffer = load_buffer_d4rl(args.expert_data_task)
+        if distributed:
+            # the buffer samples batches with its own random state, so it is seeded per rank
+            # for the ranks to train on different batches
+            replay_buffer = load_buffer_d4rl(args.expert_data_task, random_seed=args.seed + rank)
+        else:
+            replay_buffer = load_buffer_d4rl(args.expert_data_task)
         if args.norm_obs:
             replay_buffer, obs_rms = normalize_all_obs_in_replay_buffer(replay_buffer)
-            test_envs.set_obs_rms(obs_rms)
+            if test_envs is not None:
+                test_envs.set_obs_rms(obs_rms)
         # train
         result = algorithm.run_training(
             OfflineTrainerParams(
@@ -213,16 +318,28 @@ def test_td3_bc() -> None:
                 logger=logger,
             )
         )
-        pprint.pprint(result)
+        if rank == 0:
+            writer.flush()
+            pprint.pprint(result)
     else:
         watch()
 
+    if distributed:
+        dist.destroy_process_group()
+    if test_collector is None:
+        return
+
     # Let's watch its performance!
-    test_envs.seed(args.seed)
+    test_collector.env.seed(args.seed)
     test_collector.reset()
     collector_stats = test_collector.collect(n_episode=args.num_test_envs, render=args.render)
     print(collector_stats)
 
 
 if __name__ == "__main__":
-    test_td3_bc()
+    # for multi-GPU training, launch via `torchrun --nproc_per_node=<num_gpus> d4rl_td3_bc.py ...`,
+    # which sets the environment variables below
+    test_td3_bc(
+        rank=int(os.environ.get("RANK", "0")),
+        world_size=int(os.environ.get("WORLD_SIZE", "1")),
+    )
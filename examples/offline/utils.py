@@ -7,7 +7,7 @@ from tianshou.data import ReplayBuffer
 from tianshou.utils import RunningMeanStd
 
 
-def load_buffer_d4rl(expert_data_task: str) -> ReplayBuffer:
+def load_buffer_d4rl(expert_data_task: str, random_seed: int = 42) -> ReplayBuffer:
     dataset = d4rl.qlearning_dataset(gym.make(expert_data_task))
     return ReplayBuffer.from_data(
         obs=dataset["observations"],
@@ -17,6 +17,7 @@ def load_buffer_d4rl(expert_data_task: str) -> ReplayBuffer:
         obs_next=dataset["next_observations"],
         terminated=dataset["terminals"],
         truncated=np.zeros(len(dataset["terminals"])),
+        random_seed=random_seed,
     )
 
 
@@ -40,9 +41,13 @@ def normalize_all_obs_in_replay_buffer(
     obs_rms = RunningMeanStd()
     obs_rms.update(replay_buffer.obs)
     _eps = np.finfo(np.float32).eps.item()
-    # normalize obs
-    replay_buffer._meta["obs"] = (replay_buffer.obs - obs_rms.mean) / np.sqrt(obs_rms.var + _eps)
-    replay_buffer._meta["obs_next"] = (replay_buffer.obs_next - obs_rms.mean) / np.sqrt(
-        obs_rms.var + _eps,
-    )
+    inv_std = 1.0 / np.sqrt(obs_rms.var + _eps)
+    # normalize obs in-place, avoiding temporary copies of the (potentially huge) arrays
+    for key in ("obs", "obs_next"):
+        arr = replay_buffer._meta[key]
+        if not np.issubdtype(arr.dtype, np.floating):
+            arr = arr.astype(float)
+        np.subtract(arr, obs_rms.mean, out=arr)
+        np.multiply(arr, inv_std, out=arr)
+        replay_buffer._meta[key] = arr
     return replay_buffer, obs_rms
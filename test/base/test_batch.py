@@ -702,6 +702,16 @@ class TestBatchConversions:
         assert isinstance(batch.b, torch.Tensor)
         assert isinstance(batch.c.d, torch.Tensor)
 
+    @staticmethod
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="CUDA not available")
+    def test_to_torch_non_blocking() -> None:
+        batch = Batch(b=np.arange(5), c={"d": np.array([1.0, 2.0, 3.0])})
+        batch.to_torch_(device="cuda", non_blocking=True)
+        torch.cuda.synchronize()
+        assert batch.b.is_cuda
+        assert batch.c.d.is_cuda
+        assert torch.equal(batch.b.cpu(), torch.arange(5))
+
     @staticmethod
     def test_apply_array_func() -> None:
         batch = Batch(a=1, b=np.arange(3), c={"d": np.array([1, 2, 3])})
@@ -1435,6 +1435,12 @@ def test_from_data() -> None:
     next_obs = batch.obs_next
     assert isinstance(next_obs, np.ndarray)
     assert np.array_equal(next_obs, 4 * np.ones((3, 3), dtype="uint8"))
+    # the sampling seed can be set, e.g. to decorrelate the processes of a distributed run
+    with h5py.File(path, "r") as f:
+        data = [f[key] for key in ("obs", "act", "rew", "terminated", "truncated", "done")]
+        buf_a = ReplayBuffer.from_data(*data, f["obs_next"], random_seed=1)
+        buf_b = ReplayBuffer.from_data(*data, f["obs_next"], random_seed=2)
+    assert not np.array_equal(buf_a.sample_indices(20), buf_b.sample_indices(20))
     os.remove(path)
 
 
@@ -1588,3 +1594,28 @@ def test_get_vector_replay_buffer_indices(
         buffer.get_buffer_indices(3, 6)
     with pytest.raises(ValueError):
         buffer.get_buffer_indices(6, 3)
+
+
+def test_buffer_storage_device(dummy_rollout_batch: RolloutBatchProtocol) -> None:
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    buffer = ReplayBuffer(5, storage_device=device)
+    for _ in range(3):
+        buffer.add(dummy_rollout_batch)
+    assert isinstance(buffer.obs, torch.Tensor)
+    assert isinstance(buffer.act, torch.Tensor)
+    assert buffer.obs.device.type == device
+    # the data needed for index bookkeeping stays in numpy arrays
+    assert isinstance(buffer.rew, np.ndarray)
+    assert isinstance(buffer.done, np.ndarray)
+    batch, _ = buffer.sample(2)
+    assert isinstance(batch.obs, torch.Tensor)
+    assert torch.equal(batch.obs.cpu(), torch.arange(2).expand(2, 2))
+
+    stacked_batch = Batch.stack([dummy_rollout_batch, dummy_rollout_batch])
+    vector_buffer = VectorReplayBuffer(10, 2, stack_num=2, storage_device=device)
+    for _ in range(3):
+        vector_buffer.add(stacked_batch)
+    assert isinstance(vector_buffer.buffers[0].obs, torch.Tensor)
+    batch, _ = vector_buffer.sample(4)
+    assert isinstance(batch.obs, torch.Tensor)
+    assert batch.obs.shape == (4, 2, 2)
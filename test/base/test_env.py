@@ -209,6 +209,21 @@ def test_vecenv(size: int = 10, num: int = 8, sleep: float = 0.001) -> None:
         v.close()
 
 
+def test_vecenv_seed(num: int = 4) -> None:
+    env_fns = [lambda: gym.make("CartPole-v1") for _ in range(num)]
+    venvs = [DummyVectorEnv(env_fns), SubprocVectorEnv(env_fns), ShmemVectorEnv(env_fns)]
+    obs_list = []
+    for v in venvs:
+        v.seed(1)
+        obs, _ = v.reset()
+        obs_list.append(obs)
+        v.close()
+    # each env is seeded differently
+    assert len({o.tobytes() for o in obs_list[0]}) == num
+    for obs in obs_list[1:]:
+        assert np.allclose(obs, obs_list[0])
+
+
 def test_attr_unwrapped() -> None:
     training_envs = DummyVectorEnv([lambda: gym.make("CartPole-v1")])
     training_envs.set_env_attr("test_attribute", 1337)
@@ -216,6 +231,18 @@ def test_attr_unwrapped() -> None:
     assert hasattr(training_envs.workers[0].env.unwrapped, "test_attribute")  # type: ignore
 
 
+def test_worker_get_env_attrs() -> None:
+    env_fns = [lambda: gym.make("CartPole-v1")]
+    for venv in [DummyVectorEnv(env_fns), SubprocVectorEnv(env_fns)]:
+        worker = venv.workers[0]
+        action_space, observation_space = worker.get_env_attrs(
+            ["action_space", "observation_space"]
+        )
+        assert action_space == worker.action_space == gym.spaces.Discrete(2)
+        assert observation_space == venv.observation_space[0]
+        venv.close()
+
+
 def test_env_obs_dtype() -> None:
     def create_env(i: int, t: str) -> Callable[[], NXEnv]:
         return lambda: NXEnv(i, t)
@@ -11,7 +11,11 @@ from tianshou.exploration import GaussianNoise, OUNoise
 from tianshou.utils import MovAvg, RunningMeanStd
 from tianshou.utils.net.common import MLP, Net
 from tianshou.utils.net.continuous import RecurrentActorProb, RecurrentCritic
-from tianshou.utils.torch_utils import create_uniform_action_dist, torch_train_mode
+from tianshou.utils.torch_utils import (
+    compile_module,
+    create_uniform_action_dist,
+    torch_train_mode,
+)
 
 
 def test_noise() -> None:
@@ -45,6 +49,11 @@ def test_rms() -> None:
     rms.update(np.array([[[1, 2], [3, 4]], [[1, 2], [0, 0]]]))
     assert np.allclose(rms.mean, np.array([[1, 2], [2, 3]]), atol=1e-3)
     assert np.allclose(rms.var, np.array([[0, 0], [2, 14 / 3.0]]), atol=1e-3)
+    data = np.array([[[1, 2], [3, 4]]])
+    assert np.allclose(rms.norm(data), (data - rms.mean) / np.sqrt(rms.var + rms.eps))
+    # the cached inverse std must follow subsequent updates
+    rms.update(np.array([[[5, 6], [7, 8]]]))
+    assert np.allclose(rms.norm(data), (data - rms.mean) / np.sqrt(rms.var + rms.eps))
 
 
 def test_net() -> None:
@@ -127,6 +136,22 @@ def test_in_train_mode() -> None:
     assert not module.training
 
 
+def test_compile_module_without_module_compile(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # torch<2.2 lacks nn.Module.compile; the module must then be left untouched
+    monkeypatch.delattr(nn.Module, "compile", raising=False)
+    module = nn.Linear(3, 4)
+    state_dict_keys = list(module.state_dict())
+    x = torch.rand(2, 3)
+    expected = module(x)
+    assert compile_module(module) is module
+    assert list(module.state_dict()) == state_dict_keys
+    assert torch.equal(module(x), expected)
+    assert "not compiled" in caplog.text
+
+
 class TestCreateActionDistribution:
     @classmethod
     def setup_class(cls) -> None:
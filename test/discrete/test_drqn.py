@@ -17,7 +17,7 @@ from tianshou.trainer import OffPolicyTrainerParams
 from tianshou.utils import TensorboardLogger
 from tianshou.utils.net.common import Recurrent
 from tianshou.utils.space_info import SpaceInfo
-from tianshou.utils.torch_utils import policy_within_training_step
+from tianshou.utils.torch_utils import compile_module, policy_within_training_step
 
 
 def get_args() -> argparse.Namespace:
@@ -63,16 +63,21 @@ def test_drqn(args: argparse.Namespace = get_args(), enable_assertions: bool = T
             args.task,
             env.spec.reward_threshold if env.spec else None,
         )
-    # training_envs = gym.make(args.task)
-    # you can also use tianshou.env.SubprocVectorEnv
+    # classic-control envs step much faster than a round trip to a worker process, so they are
+    # stepped in-process; tianshou.env.SubprocVectorEnv pays off for envs with expensive steps
     training_envs = DummyVectorEnv(
         [lambda: gym.make(args.task) for _ in range(args.num_training_envs)]
     )
-    # test_envs = gym.make(args.task)
     test_envs = DummyVectorEnv([lambda: gym.make(args.task) for _ in range(args.num_test_envs)])
     # seed
     np.random.seed(args.seed)
     torch.manual_seed(args.seed)
+    if torch.cuda.is_available():
+        # the batch size varies between collection and update, so the first few
+        # iterations pay an autotuning cost for every new input shape
+        torch.backends.cudnn.benchmark = True
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.allow_tf32 = True
     training_envs.seed(args.seed)
     test_envs.seed(args.seed)
     # model
@@ -83,6 +88,10 @@ def test_drqn(args: argparse.Namespace = get_args(), enable_assertions: bool = T
     ).to(
         args.device,
     )
+    if args.device.startswith("cuda"):
+        # the batch size varies during collection (e.g. the test collector only steps the envs
+        # whose episodes are still running), so compile for dynamic shapes without CUDA graphs
+        net = compile_module(net, mode="default", dynamic=None)
     optim = AdamOptimizerFactory(lr=args.lr)
     policy = DiscreteQLearningPolicy(
         model=net,
@@ -124,8 +133,10 @@ def test_drqn(args: argparse.Namespace = get_args(), enable_assertions: bool = T
     def save_best_fn(policy: Algorithm) -> None:
         torch.save(policy.state_dict(), os.path.join(log_path, "policy.pth"))
 
+    reward_threshold = args.reward_threshold
+
     def stop_fn(mean_rewards: float) -> bool:
-        return mean_rewards >= args.reward_threshold
+        return mean_rewards >= reward_threshold
 
     # train
     result = algorithm.run_training(
@@ -24,6 +24,17 @@ from tianshou.highlevel.experiment import (
 )
 
 
+# the env factories are stateless, so a single instance can be shared by all tests of a module
+@pytest.fixture(scope="module")
+def continuous_env_factory() -> ContinuousTestEnvFactory:
+    return ContinuousTestEnvFactory()
+
+
+@pytest.fixture(scope="module")
+def discrete_env_factory() -> DiscreteTestEnvFactory:
+    return DiscreteTestEnvFactory()
+
+
 def create_training_config(
     builder_cls: type[ExperimentBuilder],
     num_epochs: int = 1,
@@ -65,8 +76,8 @@ def create_training_config(
 )
 def test_experiment_builder_continuous_default_params(
     builder_cls: type[ExperimentBuilder],
+    continuous_env_factory: ContinuousTestEnvFactory,
 ) -> None:
-    env_factory = ContinuousTestEnvFactory()
     training_config = create_training_config(
         builder_cls,
         num_epochs=1,
@@ -77,7 +88,7 @@ def test_experiment_builder_continuous_default_params(
     experiment_config = ExperimentConfig(persistence_enabled=False)
     builder = builder_cls(
         experiment_config=experiment_config,
-        env_factory=env_factory,
+        env_factory=continuous_env_factory,
         training_config=training_config,
     )
     experiment = builder.build()
@@ -98,8 +109,8 @@ def test_experiment_builder_continuous_default_params(
 )
 def test_experiment_builder_discrete_default_params(
     builder_cls: type[ExperimentBuilder],
+    discrete_env_factory: DiscreteTestEnvFactory,
 ) -> None:
-    env_factory = DiscreteTestEnvFactory()
     training_config = create_training_config(
         builder_cls,
         num_epochs=1,
@@ -109,7 +120,7 @@ def test_experiment_builder_discrete_default_params(
     )
     builder = builder_cls(
         experiment_config=ExperimentConfig(persistence_enabled=False),
-        env_factory=env_factory,
+        env_factory=discrete_env_factory,
         training_config=training_config,
     )
     experiment = builder.build()
@@ -1,14 +1,16 @@
 import argparse
 import os
+from typing import Any
 
+import gymnasium as gym
 import numpy as np
 import pytest
 import torch
 from torch.utils.tensorboard import SummaryWriter
 
 from tianshou.algorithm import PSRL
-from tianshou.algorithm.modelbased.psrl import PSRLPolicy
-from tianshou.data import Collector, CollectStats, VectorReplayBuffer
+from tianshou.algorithm.modelbased.psrl import PSRLModel, PSRLPolicy
+from tianshou.data import Batch, Collector, CollectStats, VectorReplayBuffer
 from tianshou.trainer import OnPolicyTrainerParams
 from tianshou.utils import LazyLogger, TensorboardLogger, WandbLogger
 
@@ -131,3 +133,128 @@ def test_psrl(args: argparse.Namespace = get_args()) -> None:
         )
     )
     assert result.best_reward >= args.reward_threshold
+
+
+def _create_psrl_policy(n_state: int, n_action: int, **kwargs: Any) -> PSRLPolicy:
+    return PSRLPolicy(
+        trans_count_prior=np.ones((n_state, n_action, n_state)),
+        rew_mean_prior=np.zeros((n_state, n_action)),
+        rew_std_prior=np.ones((n_state, n_action)),
+        action_space=gym.spaces.Discrete(n_action),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("add_done_loop", [False, True])
+def test_psrl_update_with_batch(add_done_loop: bool) -> None:
+    n_state, n_action, size = 7, 3, 200
+    rng = np.random.default_rng(0)
+    batch = Batch(
+        obs=rng.integers(0, n_state, size),
+        act=rng.integers(0, n_action, size),
+        obs_next=rng.integers(0, n_state, size),
+        rew=rng.normal(size=size),
+        done=rng.random(size) < 0.2,
+    )
+    policy = _create_psrl_policy(n_state, n_action)
+    algorithm = PSRL(policy=policy, add_done_loop=add_done_loop)
+
+    # reference: aggregate the transitions one at a time
+    trans_count = np.zeros((n_state, n_action, n_state))
+    rew_sum = np.zeros((n_state, n_action))
+    rew_square_sum = np.zeros((n_state, n_action))
+    rew_count = np.zeros((n_state, n_action))
+    for obs, act, obs_next, rew, done in zip(
+        batch.obs, batch.act, batch.obs_next, batch.rew, batch.done, strict=True
+    ):
+        trans_count[obs, act, obs_next] += 1
+        rew_sum[obs, act] += rew
+        rew_square_sum[obs, act] += rew**2
+        rew_count[obs, act] += 1
+        if add_done_loop and done:
+            trans_count[obs_next, :, obs_next] += 1
+            rew_count[obs_next, :] += 1
+
+    # reference: posterior after observing the batch twice, starting from the priors
+    model = policy.model
+    eps = np.finfo(np.float32).eps.item()
+    exp_trans_count = np.ones((n_state, n_action, n_state))
+    exp_rew_mean = np.zeros((n_state, n_action))
+    exp_rew_square_sum = np.zeros((n_state, n_action))
+    exp_rew_count = np.full((n_state, n_action), model.eps)
+    for _ in range(2):
+        algorithm._update_with_batch(batch, None, 1)
+        exp_trans_count += trans_count
+        sum_count = exp_rew_count + rew_count
+        exp_rew_mean = (exp_rew_mean * exp_rew_count + rew_sum) / sum_count
+        exp_rew_square_sum += rew_square_sum
+        raw_std2 = exp_rew_square_sum / sum_count - exp_rew_mean**2
+        exp_rew_std = np.sqrt(1 / (sum_count / (raw_std2 + eps) + 1))
+        exp_rew_count = sum_count
+
+    assert np.array_equal(model.trans_count, exp_trans_count)
+    assert np.allclose(model.rew_count, exp_rew_count)
+    assert np.allclose(model.rew_mean, exp_rew_mean)
+    assert np.allclose(model.rew_square_sum, exp_rew_square_sum)
+    assert np.allclose(model.rew_std, exp_rew_std)
+
+
+def _create_two_state_mdp() -> tuple[np.ndarray, np.ndarray]:
+    """In state 0, action 0 stays (reward 0) and action 1 moves to state 1 (reward 1).
+    In state 1, action 0 stays (reward 2) and action 1 moves to state 0 (reward 0).
+    """
+    trans_prob = np.zeros((2, 2, 2))
+    trans_prob[0, 0, 0] = trans_prob[0, 1, 1] = trans_prob[1, 0, 1] = trans_prob[1, 1, 0] = 1.0
+    rew = np.array([[0.0, 1.0], [2.0, 0.0]])
+    return trans_prob, rew
+
+
+def test_psrl_value_iteration() -> None:
+    # with gamma = 0.5, staying in state 1 is worth 2 / (1 - 0.5) = 4 and moving there from
+    # state 0 is worth 1 + 0.5 * 4 = 3, which beats staying in state 0 (worth 0)
+    trans_prob, rew = _create_two_state_mdp()
+    np.random.seed(0)
+    policy, value = PSRLModel.value_iteration(trans_prob, rew, 0.5, 1e-6, np.zeros(2))
+    assert np.array_equal(policy, [1, 0])
+    assert np.allclose(value, [3.0, 4.0], atol=1e-5)
+
+
+def test_psrl_value_iteration_stopping_rule() -> None:
+    # large values (around 1000) would let a relative tolerance stop the iteration way too early
+    n_state, n_action, gamma, eps = 10, 3, 0.99, 0.01
+    rng = np.random.default_rng(0)
+    trans_prob = rng.dirichlet(np.ones(n_state), size=(n_state, n_action)).astype(np.float32)
+    rew = rng.normal(10.0, 1.0, size=(n_state, n_action))
+    np.random.seed(0)
+    _, value = PSRLModel.value_iteration(trans_prob, rew, gamma, eps, np.zeros(n_state))
+    # the iteration stops once the values changed by less than eps, so that one more Bellman
+    # backup changes them by less than gamma * eps
+    new_value = (rew + gamma * trans_prob.astype(np.float64).dot(value)).max(axis=1)
+    assert np.abs(new_value - value).max() < gamma * eps
+    assert value.min() > 900
+
+
+def test_psrl_model_solve_policy_torch() -> None:
+    # a sharply concentrated posterior, such that the sampled MDP is (almost) deterministic
+    trans_prob, rew = _create_two_state_mdp()
+    models = [
+        PSRLModel(
+            trans_count_prior=trans_prob * 1e7 + 1e-3,
+            rew_mean_prior=rew,
+            rew_std_prior=np.full(rew.shape, 1e-8),
+            gamma=0.5,
+            epsilon=1e-4,
+            device=device,
+        )
+        for device in (None, "cpu")
+    ]
+    np.random.seed(0)
+    torch.manual_seed(0)
+    for model in models:
+        model.solve_policy()
+    numpy_model, torch_model = models
+    assert np.array_equal(numpy_model.policy, [1, 0])
+    assert np.array_equal(torch_model.policy, numpy_model.policy)
+    assert torch_model.policy.dtype == numpy_model.policy.dtype == np.int8
+    assert np.allclose(torch_model.value, numpy_model.value, atol=1e-3)
+    assert np.allclose(torch_model.value, [3.0, 4.0], atol=1e-3)
@@ -4,6 +4,7 @@ from typing import Any, cast
 import gymnasium as gym
 import numpy as np
 import torch
+from numba import njit
 
 from tianshou.algorithm.algorithm_base import (
     OnPolicyAlgorithm,
@@ -31,6 +32,7 @@ class PSRLModel:
         rew_std_prior: np.ndarray,
         gamma: float,
         epsilon: float,
+        device: str | torch.device | None = None,
     ) -> None:
         """
         :param trans_count_prior: dirichlet prior (alphas), with shape
@@ -47,13 +49,20 @@ class PSRLModel:
             increasing training variance by incorporating more environmental stochasticity.
             Typically set between 0.9 and 0.99 for most reinforcement learning tasks
         :param epsilon: for precision control in value iteration.
+        :param device: if not None, the transition probabilities are sampled and value
+            iteration is run with torch on this device (e.g. "cuda"), which pays off for
+            large state spaces. Otherwise, both run with numpy/numba on the CPU.
         """
+        self.device = torch.device(device) if device is not None else None
         self.trans_count = trans_count_prior
         self.n_state, self.n_action = rew_mean_prior.shape
-        self.rew_mean = rew_mean_prior
-        self.rew_std = rew_std_prior
-        self.rew_square_sum = np.zeros_like(rew_mean_prior)
+        # the reward statistics are updated in place by observe, so they must not share
+        # memory with the priors
+        self.rew_mean = rew_mean_prior.astype(np.float64)
+        self.rew_std = rew_std_prior.astype(np.float64)
+        self.rew_square_sum = np.zeros(rew_mean_prior.shape)
         self.rew_std_prior = rew_std_prior
+        self._inv_prior_var = 1.0 / rew_std_prior.astype(np.float64) ** 2
         self.gamma = gamma
         self.rew_count = np.full(rew_mean_prior.shape, epsilon)  # no weight
         self.eps = epsilon
@@ -88,30 +97,51 @@ class PSRLModel:
         """
         self.updated = False
         self.trans_count += trans_count
-        sum_count = self.rew_count + rew_count
-        self.rew_mean = (self.rew_mean * self.rew_count + rew_sum) / sum_count
-        self.rew_square_sum += rew_square_sum
-        raw_std2 = self.rew_square_sum / sum_count - self.rew_mean**2
-        self.rew_std = np.sqrt(
-            1 / (sum_count / (raw_std2 + self.__eps) + 1 / self.rew_std_prior**2),
+        _observe_rew(
+            self.rew_mean,
+            self.rew_std,
+            self.rew_square_sum,
+            self.rew_count,
+            rew_sum,
+            rew_square_sum,
+            rew_count,
+            self._inv_prior_var,
+            self.__eps,
         )
-        self.rew_count = sum_count
 
     def sample_trans_prob(self) -> np.ndarray:
-        return torch.distributions.Dirichlet(torch.from_numpy(self.trans_count)).sample().numpy()
+        # sample from Dir(alpha) by normalizing independent Gamma(alpha, 1) draws; this uses
+        # the global numpy RNG, just like sample_reward
+        gamma_sample = np.random.standard_gamma(self.trans_count)
+        return gamma_sample / gamma_sample.sum(axis=-1, keepdims=True)
+
+    def _sample_trans_prob_torch(self, device: torch.device) -> torch.Tensor:
+        trans_count = torch.as_tensor(self.trans_count, dtype=torch.float32, device=device)
+        return torch.distributions.Dirichlet(trans_count).sample()
 
     def sample_reward(self) -> np.ndarray:
         return np.random.normal(self.rew_mean, self.rew_std)
 
     def solve_policy(self) -> None:
         self.updated = True
-        self.policy, self.value = self.value_iteration(
-            self.sample_trans_prob(),
-            self.sample_reward(),
-            self.gamma,
-            self.eps,
-            self.value,
-        )
+        if self.device is None:
+            self.policy, self.value = self.value_iteration(
+                self.sample_trans_prob(),
+                self.sample_reward(),
+                self.gamma,
+                self.eps,
+                self.value,
+            )
+        else:
+            policy, value = self.value_iteration_torch(
+                self._sample_trans_prob_torch(self.device),
+                torch.as_tensor(self.sample_reward(), dtype=torch.float32, device=self.device),
+                self.gamma,
+                self.eps,
+                torch.as_tensor(self.value, dtype=torch.float32, device=self.device),
+            )
+            self.policy = policy.cpu().numpy().astype(_policy_dtype(self.n_action))
+            self.value = value.cpu().numpy()
 
     @staticmethod
     def value_iteration(
@@ -126,7 +156,8 @@ class PSRLModel:
         :param trans_prob: transition probabilities, with shape
             (n_state, n_action, n_state).
         :param rew: rewards, with shape (n_state, n_action).
-        :param eps: for precision control.
+        :param eps: for precision control: the iteration stops once the largest
+            absolute change of a state value is below this threshold.
         :param gamma: the discount factor in [0, 1] for future rewards.
             This determines how much future rewards are valued compared to immediate ones.
             Lower values (closer to 0) make the agent focus on immediate rewards, creating "myopic"
@@ -137,17 +168,55 @@ class PSRLModel:
         :param value: the initialize value of value array, with
             shape (n_state, ).
 
-        :return: the optimal policy with shape (n_state, ).
+        :return: the optimal policy with shape (n_state, ), stored with the smallest of
+            int8, int16 and int32 that can represent all actions,
+            and the corresponding values with shape (n_state, ).
         """
-        Q = rew + gamma * trans_prob.dot(value)
-        new_value = Q.max(axis=1)
-        while not np.allclose(new_value, value, eps):
+        # view the transition tensor as a contiguous (n_state * n_action, n_state) matrix, so
+        # that each Bellman backup is a plain matrix-vector product over contiguous rows.
+        # Streaming this matrix dominates the cost of every iteration, so it is stored in
+        # single precision, while the backups themselves are accumulated in double precision
+        n_state, n_action = rew.shape
+        trans_matrix = np.ascontiguousarray(trans_prob, dtype=np.float32).reshape(
+            n_state * n_action,
+            n_state,
+        )
+        Q, new_value = _value_iteration(trans_matrix, rew, gamma, eps, value)
+        # this is to make sure if Q(s, a1) == Q(s, a2) -> choose a1/a2 randomly;
+        # the noise is scaled and added in place to avoid further (n_state, n_action) temporaries
+        noise = np.random.standard_normal(Q.shape)
+        noise *= eps
+        Q += noise
+        return Q.argmax(axis=1).astype(_policy_dtype(n_action)), new_value
+
+    @staticmethod
+    def value_iteration_torch(
+        trans_prob: torch.Tensor,
+        rew: torch.Tensor,
+        gamma: float,
+        eps: float,
+        value: torch.Tensor,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Value iteration solver for MDPs on torch tensors, see :meth:`value_iteration`.
+
+        All tensors are expected to reside on the same device and to have the same
+        floating point dtype.
+
+        :return: the optimal policy with shape (n_state, ), and the corresponding
+            values with shape (n_state, ).
+        """
+        n_state, n_action = rew.shape
+        trans_matrix = trans_prob.reshape(n_state * n_action, n_state)
+        flat_rew = rew.reshape(-1)
+        while True:
+            Q = torch.addmv(flat_rew, trans_matrix, value, alpha=gamma).view(n_state, n_action)
+            new_value = Q.amax(dim=1)
+            if (new_value - value).abs().max().item() < eps:
+                break
             value = new_value
-            Q = rew + gamma * trans_prob.dot(value)
-            new_value = Q.max(axis=1)
         # this is to make sure if Q(s, a1) == Q(s, a2) -> choose a1/a2 randomly
-        Q += eps * np.random.randn(*Q.shape)
-        return Q.argmax(axis=1), new_value
+        Q += eps * torch.randn_like(Q)
+        return Q.argmax(dim=1), new_value
 
     def __call__(
         self,
@@ -171,6 +240,7 @@ class PSRLPolicy(Policy):
         discount_factor: float = 0.99,
         epsilon: float = 0.01,
         observation_space: gym.Space | None = None,
+        device: str | torch.device | None = None,
     ) -> None:
         """
         :param trans_count_prior: dirichlet prior (alphas), with shape
@@ -182,6 +252,9 @@ class PSRLPolicy(Policy):
         :param action_space: the environment's action_space.
         :param epsilon: for precision control in value iteration.
         :param observation_space: the environment's observation space
+        :param device: if not None, the device on which the transition probabilities are
+            sampled and value iteration is run with torch (e.g. "cuda"), which pays off for
+            large state spaces. By default, both run with numpy on the CPU.
         """
         super().__init__(
             action_space=action_space,
@@ -195,6 +268,7 @@ class PSRLPolicy(Policy):
             rew_std_prior,
             discount_factor,
             epsilon,
+            device=device,
         )
 
     def forward(
@@ -251,26 +325,112 @@ class PSRL(OnPolicyAlgorithm[PSRLPolicy]):
         #   the MDP parameters based on the collected transition data as a whole,
         #   rather than performing gradient-based updates that benefit from mini-batching.
         n_s, n_a = self.policy.model.n_state, self.policy.model.n_action
-        trans_count = np.zeros((n_s, n_a, n_s))
-        rew_sum = np.zeros((n_s, n_a))
-        rew_square_sum = np.zeros((n_s, n_a))
-        rew_count = np.zeros((n_s, n_a))
-        for minibatch in batch.split(size=1):
-            obs, act, obs_next = minibatch.obs, minibatch.act, minibatch.obs_next
-            obs_next = cast(np.ndarray, obs_next)
-            assert not isinstance(obs, Batch), "Observations cannot be Batches here"
-            obs = cast(np.ndarray, obs)
-            trans_count[obs, act, obs_next] += 1
-            rew_sum[obs, act] += minibatch.rew
-            rew_square_sum[obs, act] += minibatch.rew**2
-            rew_count[obs, act] += 1
-            if self._add_done_loop and minibatch.done:
-                # special operation for terminal states: add a self-loop
-                trans_count[obs_next, :, obs_next] += 1
-                rew_count[obs_next, :] += 1
+        assert not isinstance(batch.obs, Batch), "Observations cannot be Batches here"
+        obs = cast(np.ndarray, batch.obs)
+        act = cast(np.ndarray, batch.act)
+        obs_next = cast(np.ndarray, batch.obs_next)
+        rew = batch.rew
+        # aggregate over flattened (s, a) and (s, a, s') keys; bincount is a single pass
+        # over the batch and, unlike a scatter-add, is not slowed down by repeated keys
+        key_sa = obs * n_a + act
+        key_sas = key_sa * n_s + obs_next
+        trans_count = np.bincount(key_sas, minlength=n_s * n_a * n_s).reshape(n_s, n_a, n_s)
+        rew_sum = np.bincount(key_sa, weights=rew, minlength=n_s * n_a).reshape(n_s, n_a)
+        rew_square_sum = np.bincount(key_sa, weights=rew**2, minlength=n_s * n_a).reshape(n_s, n_a)
+        rew_count = np.bincount(key_sa, minlength=n_s * n_a).reshape(n_s, n_a)
+        if self._add_done_loop:
+            # special operation for terminal states: add a self-loop for all actions
+            terminal_count = np.bincount(obs_next[batch.done], minlength=n_s)
+            trans_count[np.arange(n_s), :, np.arange(n_s)] += terminal_count[:, None]
+            rew_count += terminal_count[:, None]
         self.policy.model.observe(trans_count, rew_sum, rew_square_sum, rew_count)
 
         return PSRLTrainingStats(
             psrl_rew_mean=float(self.policy.model.rew_mean.mean()),
             psrl_rew_std=float(self.policy.model.rew_std.mean()),
         )
+
+
+def _policy_dtype(n_action: int) -> type[np.signedinteger]:
+    """Returns the smallest signed integer dtype that can represent all actions, such that the
+    policy table looked up in every step stays compact.
+    """
+    for dtype in (np.int8, np.int16):
+        if n_action - 1 <= np.iinfo(dtype).max:
+            return dtype
+    return np.int32
+
+
+@njit(cache=True)
+def _observe_rew(
+    rew_mean: np.ndarray,
+    rew_std: np.ndarray,
+    rew_square_sum: np.ndarray,
+    rew_count: np.ndarray,
+    rew_sum_delta: np.ndarray,
+    rew_square_sum_delta: np.ndarray,
+    rew_count_delta: np.ndarray,
+    inv_prior_var: np.ndarray,
+    eps: float,
+) -> None:
+    """Updates the reward posterior statistics in place, see :meth:`PSRLModel.observe`.
+
+    All statistics of a state-action pair are computed from a single read of its entries,
+    instead of materializing a temporary array for every intermediate result.
+    """
+    n_state, n_action = rew_mean.shape
+    for s in range(n_state):
+        for a in range(n_action):
+            count = rew_count[s, a]
+            sum_count = count + rew_count_delta[s, a]
+            mean = (rew_mean[s, a] * count + rew_sum_delta[s, a]) / sum_count
+            square_sum = rew_square_sum[s, a] + rew_square_sum_delta[s, a]
+            raw_std2 = square_sum / sum_count - mean**2
+            rew_std[s, a] = np.sqrt(1 / (sum_count / (raw_std2 + eps) + inv_prior_var[s, a]))
+            rew_mean[s, a] = mean
+            rew_square_sum[s, a] = square_sum
+            rew_count[s, a] = sum_count
+
+
+@njit(cache=True, fastmath={"reassoc", "contract"})
+def _value_iteration(
+    trans_matrix: np.ndarray,
+    rew: np.ndarray,
+    gamma: float,
+    eps: float,
+    value: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Runs value iteration until convergence and returns the final Q table and values.
+
+    The Bellman backup, the max over actions and the convergence check are fused into a
+    single pass over ``trans_matrix`` (the transition tensor reshaped to
+    (n_state * n_action, n_state)) per iteration, reusing two value buffers and one Q
+    buffer instead of allocating new arrays in every iteration. The iteration stops once
+    the largest absolute change of a state value drops below ``eps``.
+
+    Only reassociation and contraction are enabled as fast-math flags, which lets the
+    row-vector dot products be vectorized like a BLAS gemv, while infinities and NaNs
+    keep their IEEE semantics.
+    """
+    n_state, n_action = rew.shape
+    q = np.empty((n_state, n_action))
+    value = value.astype(np.float64)  # copy, since the buffers are swapped below
+    new_value = np.empty(n_state)
+    while True:
+        delta = 0.0
+        for s in range(n_state):
+            best = -np.inf
+            for a in range(n_action):
+                row = trans_matrix[s * n_action + a]
+                expected = 0.0
+                for s_next in range(n_state):
+                    expected += row[s_next] * value[s_next]
+                q_sa = rew[s, a] + gamma * expected
+                q[s, a] = q_sa
+                if q_sa > best:
+                    best = q_sa
+            new_value[s] = best
+            delta = max(delta, abs(best - value[s]))
+        if delta < eps:
+            return q, new_value
+        value, new_value = new_value, value
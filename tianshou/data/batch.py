@@ -390,6 +390,7 @@ class BatchProtocol(Protocol):
         self: Self,
         dtype: torch.dtype | None = None,
         device: str | int | torch.device = "cpu",
+        non_blocking: bool = False,
     ) -> Self:
         """Change all numpy.ndarray to torch.Tensor and return a new Batch."""
         raise ProtocolCalledException
@@ -398,8 +399,16 @@ class BatchProtocol(Protocol):
         self,
         dtype: torch.dtype | None = None,
         device: str | int | torch.device = "cpu",
+        non_blocking: bool = False,
     ) -> None:
-        """Change all numpy.ndarray to torch.Tensor in-place."""
+        """Change all numpy.ndarray to torch.Tensor in-place.
+
+        :param dtype: the dtype to convert existing tensors to (numpy arrays keep their dtype).
+        :param device: the device to move the data to.
+        :param non_blocking: if True and the target is a CUDA device, numpy arrays are copied
+            to page-locked (pinned) host memory first, such that the host-to-device transfer
+            can be performed asynchronously with respect to the host.
+        """
         raise ProtocolCalledException
 
     def cat_(self, batches: Self | Sequence[dict | Self]) -> None:
@@ -874,22 +883,29 @@ class Batch(BatchProtocol):
         self: Self,
         dtype: torch.dtype | None = None,
         device: str | int | torch.device = "cpu",
+        non_blocking: bool = False,
     ) -> Self:
         result = deepcopy(self)
-        result.to_torch_(dtype=dtype, device=device)
+        result.to_torch_(dtype=dtype, device=device, non_blocking=non_blocking)
         return result
 
     def to_torch_(
         self,
         dtype: torch.dtype | None = None,
         device: str | int | torch.device = "cpu",
+        non_blocking: bool = False,
     ) -> None:
         if not isinstance(device, torch.device):
             device = torch.device(device)
+        # asynchronous host-to-device copies require the source to be in pinned memory
+        pin_memory = non_blocking and device.type == "cuda"
 
         def arr_to_torch(arr: TArr) -> TArr:
             if isinstance(arr, np.ndarray):
-                return torch.from_numpy(arr).to(device)
+                tensor = torch.from_numpy(arr)
+                if pin_memory:
+                    tensor = tensor.pin_memory()
+                return tensor.to(device, non_blocking=non_blocking)
 
             # TODO: simplify
             if (
@@ -899,7 +915,7 @@ class Batch(BatchProtocol):
             ):
                 if dtype is not None:
                     arr = arr.type(dtype)
-                return arr.to(device)
+                return arr.to(device, non_blocking=non_blocking)
             return arr
 
         self.apply_values_transform(arr_to_torch, inplace=True)
@@ -3,6 +3,7 @@ from typing import Any, ClassVar, Self, TypeVar, cast
 
 import h5py
 import numpy as np
+import torch
 from sensai.util.pickle import setstate
 
 from tianshou.data import Batch
@@ -36,6 +37,10 @@ class ReplayBuffer:
         of (timestep, ...) because of temporal stacking.
     :param sample_avail: whether to sample only available indices
         when using the frame-stack sampling method.
+    :param storage_device: if given, observations and actions are stored as torch tensors
+        on this device (e.g. "cuda"), such that sampled batches do not need to be
+        transferred to it. The remaining data (rewards, termination flags, info),
+        which is needed for the buffer's index bookkeeping, is always stored in numpy arrays.
     """
 
     _reserved_keys = (
@@ -67,6 +72,8 @@ class ReplayBuffer:
         "truncated",
         "done",
     }
+    _storage_device_keys = ("obs", "act", "obs_next")
+    """The keys whose data is stored on the storage device (if any)."""
 
     def __init__(
         self,
@@ -76,6 +83,7 @@ class ReplayBuffer:
         save_only_last_obs: bool = False,
         sample_avail: bool = False,
         random_seed: int = 42,
+        storage_device: str | torch.device | None = None,
         **kwargs: Any,  # otherwise PrioritizedVectorReplayBuffer will cause TypeError
     ) -> None:
         # TODO: why do we need this? Just for readout?
@@ -84,6 +92,7 @@ class ReplayBuffer:
             "ignore_obs_next": ignore_obs_next,
             "save_only_last_obs": save_only_last_obs,
             "sample_avail": sample_avail,
+            "storage_device": storage_device,
         }
         super().__init__()
         self.maxsize = int(size)
@@ -94,6 +103,7 @@ class ReplayBuffer:
         self._save_obs_next = not ignore_obs_next
         self._save_only_last_obs = save_only_last_obs
         self._sample_avail = sample_avail
+        self._storage_device = None if storage_device is None else torch.device(storage_device)
         self._meta = cast(RolloutBatchProtocol, Batch())
         self._random_state = np.random.RandomState(random_seed)
 
@@ -107,7 +117,10 @@ class ReplayBuffer:
             ReplayBuffer,
             self,
             state,
-            new_default_properties={"_random_state": np.random.RandomState(42)},
+            new_default_properties={
+                "_random_state": np.random.RandomState(42),
+                "_storage_device": None,
+            },
         )
 
     @property
@@ -272,12 +285,13 @@ class ReplayBuffer:
         truncated: h5py.Dataset,
         done: h5py.Dataset,
         obs_next: h5py.Dataset,
+        random_seed: int = 42,
     ) -> Self:
         size = len(obs)
         assert all(
             len(dset) == size for dset in [obs, act, rew, terminated, truncated, done, obs_next]
         ), "Lengths of all hdf5 datasets need to be equal."
-        buf = cls(size)
+        buf = cls(size, random_seed=random_seed)
         if size == 0:
             return buf
         batch = Batch(
@@ -417,6 +431,23 @@ class ReplayBuffer:
             )
         return result
 
+    def _move_to_storage_device(self, batch: RolloutBatchProtocol) -> None:
+        """Converts the data of the keys stored on the storage device (if any) to tensors on that device.
+
+        Since the storage is allocated based on the first added batch, this also determines
+        where the data is stored.
+        """
+        if self._storage_device is None:
+            return
+        for key in self._storage_device_keys:
+            if key not in batch.get_keys():
+                continue
+            val = batch[key]
+            if isinstance(val, Batch):
+                batch.__dict__[key] = val.to_torch(device=self._storage_device)
+            else:
+                batch.__dict__[key] = torch.as_tensor(val, device=self._storage_device)
+
     def add(
         self,
         batch: RolloutBatchProtocol,
@@ -475,6 +506,7 @@ class ReplayBuffer:
             batch.pop("obs_next", None)
         elif self._save_only_last_obs:
             batch.obs_next = batch.obs_next[:, -1] if batch_is_stacked else batch.obs_next[-1]
+        self._move_to_storage_device(batch)
 
         if batch_is_stacked:
             rew, done = batch.rew[0], batch.done[0]
@@ -564,7 +596,7 @@ class ReplayBuffer:
         # TODO 2: does something entirely different from getitem
         # TODO 3: key should not be required
         stack_num: int | None = None,
-    ) -> Batch | np.ndarray:
+    ) -> Batch | np.ndarray | torch.Tensor:
         """Return the stacked result.
 
         E.g., if you set ``key = "obs", stack_num = 4, index = t``, it returns the
@@ -595,6 +627,8 @@ class ReplayBuffer:
             indices = cast(np.ndarray, indices)
             if isinstance(val, Batch):
                 return Batch.stack(stack, axis=indices.ndim)
+            if isinstance(val, torch.Tensor):
+                return torch.stack(stack, dim=indices.ndim)
             return np.stack(stack, axis=indices.ndim)
 
         except IndexError as exception:
@@ -155,6 +155,7 @@ class ReplayBufferManager(ReplayBuffer):
             batch.pop("obs_next", None)
         elif self._save_only_last_obs:
             batch.obs_next = batch.obs_next[:, -1]
+        self._move_to_storage_device(batch)
         # get index
         if buffer_ids is None:
             buffer_ids = np.arange(self.buffer_num)
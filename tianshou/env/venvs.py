@@ -278,13 +278,11 @@ class BaseVectorEnv:
             if action is None:
                 raise ValueError("action must be not-None for non-async")
             assert len(action) == len(id)
-            for i, j in enumerate(id):
-                self.workers[j].send(action[i])
-            result = []
-            for j in id:
-                env_return = self.workers[j].recv()
+            result: list[gym_new_venv_step_type | tuple[np.ndarray, dict]] = []
+            workers = [self.workers[j] for j in id]
+            result.extend(self.worker_class.step_batch(workers, action))  # type: ignore[arg-type]
+            for j, env_return in zip(id, result, strict=True):
                 env_return[-1]["env_id"] = j
-                result.append(env_return)
         else:
             if action is not None:
                 self._assert_id(id)
@@ -313,12 +311,14 @@ class BaseVectorEnv:
             obs_stack = np.stack(obs_list)
         except ValueError:  # different len(obs)
             obs_stack = np.array(obs_list, dtype=object)
+        # rew, terminated, truncated and info hold one scalar (or dict) per env; building the
+        # arrays directly avoids np.stack wrapping every single element into an array first
         return (
             obs_stack,
-            np.stack(rew_list),
-            np.stack(term_list),
-            np.stack(trunc_list),
-            np.stack(info_list),
+            np.array(rew_list),
+            np.array(term_list),
+            np.array(trunc_list),
+            np.array(info_list),
         )
 
     def seed(self, seed: int | list[int] | None = None) -> list[list[int] | None]:
@@ -339,7 +339,7 @@ class BaseVectorEnv:
             seed_list = [seed + i for i in range(self.env_num)]
         else:
             seed_list = seed
-        return [w.seed(s) for w, s in zip(self.workers, seed_list, strict=True)]
+        return self.worker_class.seed_batch(self.workers, seed_list)
 
     def render(self, **kwargs: Any) -> list[Any]:
         """Render all of the environments."""
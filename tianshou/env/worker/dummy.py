@@ -4,6 +4,7 @@ from typing import Any
 import gymnasium as gym
 import numpy as np
 
+from tianshou.env.utils import gym_new_venv_step_type
 from tianshou.env.worker import EnvWorker
 
 
@@ -40,6 +41,14 @@ class DummyEnvWorker(EnvWorker):
         else:
             self.result = self.env.step(action)  # type: ignore
 
+    @staticmethod
+    def step_batch(  # type: ignore
+        workers: list["DummyEnvWorker"],
+        actions: np.ndarray | list[np.ndarray],
+    ) -> list[gym_new_venv_step_type]:
+        # the environments live in this process, so they can be stepped directly
+        return [w.env.step(a) for w, a in zip(workers, actions, strict=True)]  # type: ignore
+
     def seed(self, seed: int | None = None) -> list[int] | None:
         super().seed(seed)
         try:
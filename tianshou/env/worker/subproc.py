@@ -1,5 +1,6 @@
 import ctypes
 import multiprocessing
+import sys
 import time
 from collections.abc import Callable
 from multiprocessing import connection
@@ -176,6 +177,12 @@ class SubprocEnvWorker(EnvWorker):
         self.parent_remote.send(["getattr", key])
         return self.parent_remote.recv()
 
+    def get_env_attrs(self, keys: list[str]) -> list[Any]:
+        # send all requests before receiving, such that they cost a single round trip
+        for key in keys:
+            self.parent_remote.send(["getattr", key])
+        return [self.parent_remote.recv() for _ in keys]
+
     def set_env_attr(self, key: str, value: Any) -> None:
         self.parent_remote.send(["setattr", {"key": key, "value": value}])
 
@@ -193,25 +200,31 @@ class SubprocEnvWorker(EnvWorker):
 
         return decode_obs(self.buffer)
 
+    def fileno(self) -> int:
+        return self.parent_remote.fileno()
+
     @staticmethod
     def wait(  # type: ignore
         workers: list["SubprocEnvWorker"],
         wait_num: int,
         timeout: float | None = None,
     ) -> list["SubprocEnvWorker"]:
-        remain_conns = conns = [x.parent_remote for x in workers]
-        ready_conns: list[connection.Connection] = []
-        remain_time, t1 = timeout, time.time()
-        while len(remain_conns) > 0 and len(ready_conns) < wait_num:
-            if timeout:
-                remain_time = timeout - (time.time() - t1)
-                if remain_time <= 0:
-                    break
-            # connection.wait hangs if the list is empty
-            new_ready_conns = connection.wait(remain_conns, timeout=remain_time)  # type: ignore
-            ready_conns.extend(new_ready_conns)  # type: ignore
-            remain_conns = [conn for conn in remain_conns if conn not in ready_conns]  # type: ignore
-        return [workers[conns.index(con)] for con in ready_conns]  # type: ignore
+        if sys.platform == "win32":
+            # selectors only support sockets on Windows, so use multiprocessing's wait instead
+            remain_conns = conns = [x.parent_remote for x in workers]
+            ready_conns: list[connection.Connection] = []
+            remain_time, t1 = timeout, time.time()
+            while len(remain_conns) > 0 and len(ready_conns) < wait_num:
+                if timeout:
+                    remain_time = timeout - (time.time() - t1)
+                    if remain_time <= 0:
+                        break
+                # connection.wait hangs if the list is empty
+                new_ready_conns = connection.wait(remain_conns, timeout=remain_time)  # type: ignore
+                ready_conns.extend(new_ready_conns)  # type: ignore
+                remain_conns = [conn for conn in remain_conns if conn not in ready_conns]  # type: ignore
+            return [workers[conns.index(con)] for con in ready_conns]  # type: ignore
+        return EnvWorker.wait(workers, wait_num, timeout)  # type: ignore
 
     def send(self, action: np.ndarray | None, **kwargs: Any) -> None:
         if action is None:
@@ -221,6 +234,16 @@ class SubprocEnvWorker(EnvWorker):
         else:
             self.parent_remote.send(["step", action])
 
+    @staticmethod
+    def step_batch(  # type: ignore
+        workers: list["SubprocEnvWorker"],
+        actions: np.ndarray | list[np.ndarray],
+    ) -> list[gym_new_venv_step_type]:
+        # send all actions first, such that the subprocesses step their envs concurrently
+        for w, a in zip(workers, actions, strict=True):
+            w.parent_remote.send(["step", a])
+        return [w.recv() for w in workers]  # type: ignore
+
     def recv(self) -> gym_new_venv_step_type | tuple[np.ndarray, dict]:
         result = self.parent_remote.recv()
         if isinstance(result, tuple):
@@ -260,6 +283,24 @@ class SubprocEnvWorker(EnvWorker):
         self.parent_remote.send(["seed", seed])
         return self.parent_remote.recv()
 
+    @staticmethod
+    def seed_batch(  # type: ignore
+        workers: list["SubprocEnvWorker"],
+        seeds: list[int] | list[None],
+    ) -> list[list[int] | None]:
+        # fetch the action spaces that have not been accessed yet in one go, rather than
+        # one round trip per worker when seeding them below
+        missing = [w for w in workers if w._action_space is None]
+        for w in missing:
+            w.parent_remote.send(["getattr", "action_space"])
+        for w in missing:
+            w._action_space = w.parent_remote.recv()
+        # send all seed requests first, such that the subprocesses seed their envs concurrently
+        for w, s in zip(workers, seeds, strict=True):
+            EnvWorker.seed(w, s)
+            w.parent_remote.send(["seed", s])
+        return [w.parent_remote.recv() for w in workers]
+
     def render(self, **kwargs: Any) -> Any:
         self.parent_remote.send(["render", kwargs])
         return self.parent_remote.recv()
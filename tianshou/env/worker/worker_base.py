@@ -1,3 +1,5 @@
+import selectors
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from typing import Any
@@ -7,6 +9,10 @@ import numpy as np
 
 from tianshou.env.utils import gym_new_venv_step_type
 
+# poll does not require registering the file descriptors with the kernel, which makes it
+# cheaper than epoll/kqueue for selectors that are only used for a single wait call
+_WaitSelector = getattr(selectors, "PollSelector", selectors.SelectSelector)
+
 
 class EnvWorker(ABC):
     """An abstract worker for an environment."""
@@ -15,13 +21,33 @@ class EnvWorker(ABC):
         self._env_fn = env_fn
         self.is_closed = False
         self.result: gym_new_venv_step_type | tuple[np.ndarray, dict]
-        self.action_space = self.get_env_attr("action_space")
+        self._action_space: gym.Space | None = None
         self.is_reset = False
 
+    @property
+    def action_space(self) -> gym.Space:
+        """The environment's action space, which is fetched from the environment on first
+        access (rather than when the worker is created).
+        """
+        if self._action_space is None:
+            self._action_space = self.get_env_attr("action_space")
+        return self._action_space
+
     @abstractmethod
     def get_env_attr(self, key: str) -> Any:
         pass
 
+    def get_env_attrs(self, keys: list[str]) -> list[Any]:
+        """Get several attributes of the environment at once.
+
+        Workers whose attribute lookups involve a round trip to another process may
+        override this to fetch all attributes in a single round trip.
+
+        :param keys: the names of the attributes
+        :return: the attribute values, in the order of ``keys``
+        """
+        return [self.get_env_attr(key) for key in keys]
+
     @abstractmethod
     def set_env_attr(self, key: str, value: Any) -> None:
         pass
@@ -59,14 +85,58 @@ class EnvWorker(ABC):
         self.send(action)
         return self.recv()  # type: ignore
 
+    @staticmethod
+    def step_batch(
+        workers: list["EnvWorker"],
+        actions: np.ndarray | list[np.ndarray],
+    ) -> list[gym_new_venv_step_type]:
+        """Perform one timestep in each of the given workers' environments, where the i-th
+        worker receives the i-th action.
+
+        All actions are sent before the first result is received, such that workers running
+        in other processes can step concurrently. Subclasses may override this to bypass
+        the per-worker "send"/"recv" dispatch.
+
+        :param workers: the workers to step
+        :param actions: the actions, one per worker
+        :return: the results of the workers' steps
+        """
+        for w, a in zip(workers, actions, strict=True):
+            w.send(a)
+        return [w.recv() for w in workers]  # type: ignore
+
+    def fileno(self) -> int:
+        """Return a file descriptor that becomes readable once a result can be received.
+
+        Workers implementing this can rely on the default implementation of :meth:`wait`.
+        """
+        raise NotImplementedError
+
     @staticmethod
     def wait(
         workers: list["EnvWorker"],
         wait_num: int,
         timeout: float | None = None,
     ) -> list["EnvWorker"]:
-        """Given a list of workers, return those ready ones."""
-        raise NotImplementedError
+        """Given a list of workers, return those ready ones.
+
+        The default implementation waits for the workers' :meth:`fileno` to become
+        readable, using a single selector for all of them.
+        """
+        ready_workers: list[EnvWorker] = []
+        remain_time, t1 = timeout, time.time()
+        with _WaitSelector() as selector:
+            for w in workers:
+                selector.register(w.fileno(), selectors.EVENT_READ, w)
+            while len(ready_workers) < min(wait_num, len(workers)):
+                if timeout:
+                    remain_time = timeout - (time.time() - t1)
+                    if remain_time <= 0:
+                        break
+                for key, _ in selector.select(remain_time):
+                    ready_workers.append(key.data)
+                    selector.unregister(key.fileobj)
+        return ready_workers
 
     def seed(self, seed: int | None = None) -> list[int] | None:
         """
@@ -76,7 +146,23 @@ class EnvWorker(ABC):
         :param seed: the random seed
         :return: a list containing the resulting seed used
         """
-        return self.action_space.seed(seed)
+        return self.action_space.seed(seed)  # type: ignore[return-value]
+
+    @staticmethod
+    def seed_batch(
+        workers: list["EnvWorker"],
+        seeds: list[int] | list[None],
+    ) -> list[list[int] | None]:
+        """Seed the given workers, where the i-th worker is seeded with the i-th seed.
+
+        Workers whose seeding involves a round trip to another process may override this
+        to dispatch all requests before waiting for the results.
+
+        :param workers: the workers to seed
+        :param seeds: the seeds, one per worker
+        :return: the results of the workers' :meth:`seed` calls
+        """
+        return [w.seed(s) for w, s in zip(workers, seeds, strict=True)]
 
     @abstractmethod
     def render(self, **kwargs: Any) -> Any:
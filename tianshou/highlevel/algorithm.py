@@ -85,6 +85,7 @@ from tianshou.trainer import (
     Trainer,
 )
 from tianshou.utils.net.discrete import DiscreteActor
+from tianshou.utils.torch_utils import compile_module
 
 CHECKPOINT_DICT_KEY_MODEL = "model"
 CHECKPOINT_DICT_KEY_OBS_RMS = "obs_rms"
@@ -524,12 +525,21 @@ class DDPGAlgorithmFactory(OffPolicyAlgorithmFactory):
         actor_factory: ActorFactory,
         critic_factory: CriticFactory,
         optim_factory: OptimizerFactoryFactory,
+        compile_model: bool = False,
     ):
+        """
+        :param compile_model: whether to compile the forward passes of the actor and critic
+            via `torch.compile` (see :func:`~tianshou.utils.torch_utils.compile_module`).
+            The actor, which also serves the collectors (whose batch size varies, e.g. as
+            episodes end), is compiled for dynamic shapes; the critic, which is only applied
+            to fixed-size update batches, uses CUDA graphs.
+        """
         super().__init__(training_config, optim_factory)
         self.critic_factory = critic_factory
         self.actor_factory = actor_factory
         self.params = params
         self.optim_factory = optim_factory
+        self.compile_model = compile_model
 
     def _create_algorithm(self, envs: Environments, device: TDevice) -> Algorithm:
         actor = self.actor_factory.create_module(envs, device)
@@ -538,6 +548,9 @@ class DDPGAlgorithmFactory(OffPolicyAlgorithmFactory):
             device,
             True,
         )
+        if self.compile_model:
+            compile_module(actor, mode="default", dynamic=None)
+            compile_module(critic)
         kwargs = self.params.create_kwargs(
             ParamTransformerData(
                 envs=envs,
@@ -627,13 +640,22 @@ class ActorDualCriticsOffPolicyAlgorithmFactory(
         critic1_factory: CriticFactory,
         critic2_factory: CriticFactory,
         optim_factory: OptimizerFactoryFactory,
+        compile_model: bool = False,
     ):
+        """
+        :param compile_model: whether to compile the forward passes of the actor and critics
+            via `torch.compile` (see :func:`~tianshou.utils.torch_utils.compile_module`).
+            The actor, which also serves the collectors (whose batch size varies, e.g. as
+            episodes end), is compiled for dynamic shapes; the critics, which are only applied
+            to fixed-size update batches, use CUDA graphs.
+        """
         super().__init__(training_config, optim_factory)
         self.params = params
         self.actor_factory = actor_factory
         self.critic1_factory = critic1_factory
         self.critic2_factory = critic2_factory
         self.optim_factory = optim_factory
+        self.compile_model = compile_model
 
     @abstractmethod
     def _get_algorithm_class(self) -> type[TAlgorithm]:
@@ -669,6 +691,10 @@ class ActorDualCriticsOffPolicyAlgorithmFactory(
             use_action=critic_use_action,
             discrete_last_size_use_action_shape=use_action_shape,
         )
+        if self.compile_model:
+            compile_module(actor, mode="default", dynamic=None)
+            for critic in (critic1, critic2):
+                compile_module(critic)
         kwargs = self.params.create_kwargs(
             ParamTransformerData(
                 envs=envs,
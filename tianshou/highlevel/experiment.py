@@ -1355,11 +1355,22 @@ class DDPGExperimentBuilder(
         env_factory: EnvFactory,
         experiment_config: ExperimentConfig | None = None,
         training_config: OffPolicyTrainingConfig | None = None,
+        compile_model: bool = False,
     ):
+        """
+        :param env_factory: controls how environments are to be created.
+        :param experiment_config: the configuration for the experiment. If None, will use the default values
+            of :class:`ExperimentConfig`.
+        :param training_config: the training configuration to use. If None, use default values (not recommended).
+        :param compile_model: whether to compile the actor and critic networks via `torch.compile`.
+            This reduces the per-call overhead of small networks (particularly on GPUs) at the cost of
+            an initial compilation delay.
+        """
         super().__init__(env_factory, experiment_config, training_config)
         _BuilderMixinActorFactory_ContinuousDeterministic.__init__(self)
         _BuilderMixinSingleCriticCanUseActorFactory.__init__(self, self)
         self._params: DDPGParams = DDPGParams()
+        self._compile_model = compile_model
 
     def with_ddpg_params(self, params: DDPGParams) -> Self:
         self._params = params
@@ -1372,6 +1383,7 @@ class DDPGExperimentBuilder(
             self._get_actor_factory(),
             self._get_critic_factory(0),
             self._get_optim_factory(),
+            compile_model=self._compile_model,
         )
 
 
@@ -1477,11 +1489,22 @@ class TD3ExperimentBuilder(
         env_factory: EnvFactory,
         experiment_config: ExperimentConfig | None = None,
         training_config: OffPolicyTrainingConfig | None = None,
+        compile_model: bool = False,
     ):
+        """
+        :param env_factory: controls how environments are to be created.
+        :param experiment_config: the configuration for the experiment. If None, will use the default values
+            of :class:`ExperimentConfig`.
+        :param training_config: the training configuration to use. If None, use default values (not recommended).
+        :param compile_model: whether to compile the actor and critic networks via `torch.compile`.
+            This reduces the per-call overhead of small networks (particularly on GPUs) at the cost of
+            an initial compilation delay.
+        """
         super().__init__(env_factory, experiment_config, training_config)
         _BuilderMixinActorFactory_ContinuousDeterministic.__init__(self)
         _BuilderMixinDualCriticFactory.__init__(self, self)
         self._params: TD3Params = TD3Params()
+        self._compile_model = compile_model
 
     def with_td3_params(self, params: TD3Params) -> Self:
         self._params = params
@@ -1495,4 +1518,5 @@ class TD3ExperimentBuilder(
             self._get_critic_factory(0),
             self._get_critic_factory(1),
             self._get_optim_factory(),
+            compile_model=self._compile_model,
         )
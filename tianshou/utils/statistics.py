@@ -89,9 +89,20 @@ class RunningMeanStd:
         self.clip_max = clip_max
         self.count = 0
         self.eps = epsilon
+        # norm is typically called far more often than update, so the inverse std is cached;
+        # it is recomputed whenever `var` is rebound (as done by update)
+        self._inv_std: float | np.ndarray = 1.0
+        self._inv_std_var: float | np.ndarray | None = None
+
+    def _get_inv_std(self) -> float | np.ndarray:
+        # instances unpickled from older versions do not have the cache attributes
+        if getattr(self, "_inv_std_var", None) is not self.var:
+            self._inv_std = 1.0 / np.sqrt(self.var + self.eps)
+            self._inv_std_var = self.var
+        return self._inv_std
 
     def norm(self, data_array: float | np.ndarray) -> float | np.ndarray:
-        data_array = (data_array - self.mean) / np.sqrt(self.var + self.eps)
+        data_array = (data_array - self.mean) * self._get_inv_std()
         if self.clip_max:
             data_array = np.clip(data_array, -self.clip_max, self.clip_max)
         return data_array
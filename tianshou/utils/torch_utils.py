@@ -1,3 +1,4 @@
+import logging
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, overload
@@ -10,6 +11,8 @@ from torch import nn
 if TYPE_CHECKING:
     from tianshou.algorithm import algorithm_base
 
+log = logging.getLogger(__name__)
+
 
 @contextmanager
 def torch_train_mode(module: nn.Module, enabled: bool = True) -> Iterator[None]:
@@ -86,3 +89,40 @@ def torch_device(module: torch.nn.Module) -> torch.device:
         return next(module.parameters()).device
     except StopIteration:
         return torch.device("cpu")
+
+
+def compile_module(
+    module: nn.Module,
+    mode: str = "reduce-overhead",
+    dynamic: bool | None = False,
+) -> nn.Module:
+    """Compiles the forward pass of the given module in place using `torch.compile`.
+
+    In contrast to calling `torch.compile(module)`, the module retains its type and the keys
+    of its state dict, such that checkpoints remain compatible with the uncompiled module.
+    Compilation is deferred until the first forward call. By default, shapes are assumed to be
+    static, i.e. every new input shape (e.g. a different batch size) triggers a recompilation.
+    With torch versions prior to 2.2, which lack in-place module compilation, the module is
+    left uncompiled and a warning is logged.
+
+    :param module: the module to compile
+    :param mode: the compilation mode; the default `"reduce-overhead"` uses CUDA graphs
+        to reduce the launch overhead that dominates for small networks. For modules
+        receiving many different input shapes, use `"default"` instead, since every shape
+        would record a CUDA graph of its own.
+    :param dynamic: whether to compile for dynamic shapes; the default `False` specializes
+        the compiled code to each input shape, whereas `None` lets torch switch to dynamic
+        shapes once a shape changes
+    :return: the same module instance (for convenience)
+    """
+    # nn.Module.compile is only available as of torch 2.2. Emulating it by replacing `forward`
+    # would not be safe, because the compiled function would be shared by deep copies of the
+    # module (e.g. lagged target networks), so the module is left uncompiled instead.
+    if not hasattr(module, "compile"):
+        log.warning(
+            f"In-place module compilation requires torch>=2.2 (found {torch.__version__}); "
+            f"{module.__class__.__name__} is not compiled.",
+        )
+        return module
+    module.compile(mode=mode, dynamic=dynamic)
+    return module